@@ -6,10 +6,11 @@ Note: 100% AI generated, don't try to decipher it ^^
 
 Features:
 - Enumerates all fuzz surefire executions from pom.xml (profile: fuzz)
-- Runs each fuzz test as an individual Maven command
+- Resolves dependencies and compiles once into a shared local repository (<out_dir>/.m2-repo)
+- Runs each fuzz test as an individual (offline) Maven command
 - Parallel execution with configurable concurrency
 - Configurable Jazzer duration per test
-- Isolates each run's Maven target directory via -Dproject.build.directory to avoid interference
+- Isolates each run in its own work dir (symlink farm, overlayfs or full copy) with a private target/
 - In-progress status updates (live summary)
 - Final JSON and HTML reports with per-test logs and findings
 
@@ -26,6 +27,9 @@ Examples:
   # Filter tests by substring (on execution id or <test> value)
   python3 scripts/fuzz_runner.py -f LZ4DecompressorTest#native_fast_array
 
+  # Split the suite across 4 CI machines; this one runs the second quarter
+  python3 scripts/fuzz_runner.py --shard 2/4
+
 Notes:
 - Uses ./mvnw by default (recommended per project guide).
 - Writes per-test outputs into <out_dir>/<execId-sanitized>.
@@ -35,22 +39,32 @@ Notes:
 
 import argparse
 import asyncio
+import collections
 import dataclasses
 import datetime as dt
-import html
+import functools
+import hashlib
 import json
 import os
 import re
 import shutil
 import signal
+import stat
+import subprocess
 import sys
 import time
-import traceback
-import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Deque, Dict, List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # optional; falls back to the stdlib encoder
+    orjson = None
 
-POM_NS = {"m": "http://maven.apache.org/POM/4.0.0"}
+try:
+    import psutil
+except ImportError:  # optional; falls back to os.sysconf
+    psutil = None
 
 
 @dataclasses.dataclass
@@ -59,6 +73,8 @@ class FuzzExecution:
     test_spec: str     # value in <test> (e.g., net.jpountz.fuzz.LZ4DecompressorTest#safe_fast_array)
     surefire_version: str
     profile_id: str = "fuzz"
+    # Executions merged into this one by --batch-by-class (empty for regular executions)
+    members: List["FuzzExecution"] = dataclasses.field(default_factory=list)
 
     @property
     def test_class(self) -> Optional[str]:
@@ -71,76 +87,216 @@ class FuzzExecution:
         return parts[1] if len(parts) == 2 else None
 
 
+@dataclasses.dataclass(slots=True)
+class JobPaths:
+    job_root: Path             # <out_dir>/<execId-sanitized>
+    work_dir: Path             # isolated project view the job runs in
+    target_dir: Path           # Maven build directory of the job
+    findings_dir: Path
+    log_path: Path
+    surefire_report_dir: Path
+
+    @classmethod
+    def for_execution(cls, out_dir: Path, execution_id: str) -> "JobPaths":
+        job_root = out_dir / sanitize_for_path(execution_id)
+        work_dir = job_root / "work"
+        target_dir = work_dir / "target"
+        return cls(
+            job_root=job_root,
+            work_dir=work_dir,
+            target_dir=target_dir,
+            findings_dir=job_root / "findings",
+            log_path=job_root / "build.log",
+            surefire_report_dir=target_dir / "surefire-reports",
+        )
+
+
 @dataclasses.dataclass
 class JobResult:
-    status: str  # queued, running, passed, failed, cancelled
+    status: str  # queued, running, passed, failed, cancelled, skipped
     execution: FuzzExecution
-    build_dir: Path
-    findings_dir: Path
-    log_path: Path
+    paths: JobPaths
     start_time: Optional[float] = None
     end_time: Optional[float] = None
     exit_code: Optional[int] = None
     command: Optional[List[str]] = None
-    last_lines: List[str] = dataclasses.field(default_factory=list)
-    surefire_report_dir: Optional[Path] = None
+    # Raw tail of the job log, decoded only when somebody reads last_lines
+    tail: Deque[bytes] = dataclasses.field(default_factory=lambda: collections.deque(maxlen=TAIL_LINES))
+
+    @property
+    def build_dir(self) -> Path:
+        return self.paths.target_dir
+
+    @property
+    def findings_dir(self) -> Path:
+        return self.paths.findings_dir
+
+    @property
+    def log_path(self) -> Path:
+        return self.paths.log_path
+
+    @property
+    def surefire_report_dir(self) -> Path:
+        return self.paths.surefire_report_dir
+
+    @property
+    def last_lines(self) -> List[str]:
+        return [line.decode(errors="replace").rstrip() for line in self.tail]
+
+
+# Byte translation table marking everything outside [A-Za-z0-9._-] with NUL; runs of NUL become "_"
+_SAFE_PATH_TABLE = bytes(c if (c < 128 and (chr(c).isalnum() or chr(c) in "._-")) else 0 for c in range(256))
+_UNSAFE_RUN = re.compile(rb"\x00+")
 
 
 def sanitize_for_path(s: str) -> str:
     # Avoid overly long paths but keep uniqueness by hashing tail
-    safe = re.sub(r"[^A-Za-z0-9._-]+", "_", s)
+    safe = s.encode("utf-8", "replace").translate(_SAFE_PATH_TABLE)
+    if b"\x00" in safe:
+        safe = _UNSAFE_RUN.sub(b"_", safe)
     if len(safe) > 150:
-        import hashlib
-        h = hashlib.sha1(safe.encode()).hexdigest()[:8]
-        safe = safe[:120] + "_" + h
-    return safe
+        h = hashlib.blake2b(safe, digest_size=4).hexdigest().encode()
+        safe = safe[:120] + b"_" + h
+    return safe.decode("ascii")
+
+
+def _xml_etree():
+    # Imported on first use; lxml's C parser is preferred when installed
+    try:
+        import lxml.etree as ET
+    except ImportError:
+        import xml.etree.ElementTree as ET
+    return ET
+
+
+# Parsed executions keyed by (pom path, pom mtime, profile id)
+_EXECUTIONS_CACHE: Dict[Tuple[str, int, str], List[FuzzExecution]] = {}
 
 
 def read_pom_executions(pom_path: Path, profile_id: str = "fuzz") -> List[FuzzExecution]:
-    tree = ET.parse(str(pom_path))
-    root = tree.getroot()
-
-    # Find the target profile
-    profile_node = None
-    for p in root.findall("m:profiles/m:profile", POM_NS):
-        pid = p.findtext("m:id", default="", namespaces=POM_NS)
-        if pid == profile_id:
-            profile_node = p
-            break
-    if profile_node is None:
+    key = (str(pom_path), pom_path.stat().st_mtime_ns, profile_id)
+    cached = _EXECUTIONS_CACHE.get(key)
+    if cached is None:
+        cached = _EXECUTIONS_CACHE[key] = _read_pom_executions(pom_path, profile_id)
+    return list(cached)
+
+
+# Element paths (namespace stripped) relevant to fuzz executions
+_PROFILE = ("project", "profiles", "profile")
+_PLUGIN = _PROFILE + ("build", "plugins", "plugin")
+_EXECUTION = _PLUGIN + ("executions", "execution")
+_EXECUTION_CONFIG = _EXECUTION + ("configuration",)
+_PLUGIN_ENV = _PLUGIN + ("configuration", "environmentVariables")
+
+
+def _read_pom_executions(pom_path: Path, profile_id: str) -> List[FuzzExecution]:
+    # Single streaming pass; state is committed when the enclosing element ends,
+    # so the order of <id>/<artifactId> relative to their siblings does not matter
+    ET = _xml_etree()
+    path: List[str] = []
+    found_profile = False
+    surefire_found = False
+    surefire_version = None
+    specs: List[Tuple[str, str]] = []
+
+    cur_profile_id = ""
+    profile_plugins: List[Tuple[str, str, List[Tuple[str, str]]]] = []
+    artifact_id = version = ""
+    plugin_execs: List[Tuple[str, str]] = []
+    exec_id = test_spec = ""
+
+    for event, elem in ET.iterparse(str(pom_path), events=("start", "end")):
+        if event == "start":
+            path.append(elem.tag.rsplit("}", 1)[-1])
+            continue
+        here = tuple(path)
+        parent, name = here[:-1], here[-1]
+        if parent == _PROFILE and name == "id":
+            cur_profile_id = (elem.text or "").strip()
+        elif parent == _PLUGIN and name == "artifactId":
+            artifact_id = (elem.text or "").strip()
+        elif parent == _PLUGIN and name == "version":
+            version = (elem.text or "").strip()
+        elif parent == _EXECUTION and name == "id":
+            exec_id = (elem.text or "").strip()
+        elif parent == _EXECUTION_CONFIG and name == "test":
+            test_spec = (elem.text or "").strip()
+        elif here == _EXECUTION:
+            plugin_execs.append((exec_id, test_spec))
+            exec_id = test_spec = ""
+        elif here == _PLUGIN:
+            profile_plugins.append((artifact_id, version, plugin_execs))
+            artifact_id = version = ""
+            plugin_execs = []
+        elif here == _PROFILE:
+            if cur_profile_id == profile_id and not found_profile:
+                found_profile = True
+                for aid, ver, execs in profile_plugins:
+                    if aid == "maven-surefire-plugin":
+                        surefire_found = True
+                        if ver:
+                            surefire_version = ver
+                        specs.extend(execs)
+            cur_profile_id = ""
+            profile_plugins = []
+        path.pop()
+        elem.clear()
+
+    if not found_profile:
         raise RuntimeError(f"Profile '{profile_id}' not found in {pom_path}")
 
-    surefire_nodes = []
-    surefire_version = None
-    for plugin in profile_node.findall("m:build/m:plugins/m:plugin", POM_NS):
-        artifact_id = plugin.findtext("m:artifactId", default="", namespaces=POM_NS)
-        group_id = plugin.findtext("m:groupId", default="", namespaces=POM_NS)
-        if artifact_id == "maven-surefire-plugin":
-            surefire_nodes.append(plugin)
-            v = plugin.findtext("m:version", default="", namespaces=POM_NS)
-            if v:
-                surefire_version = v
-
-    if not surefire_nodes:
+    if not surefire_found:
         raise RuntimeError("No maven-surefire-plugin found in fuzz profile")
 
     if not surefire_version:
         # Fallback to commonly used version in this repo
         surefire_version = "3.2.5"
 
-    executions: List[FuzzExecution] = []
-    for sn in surefire_nodes:
-        for exec_node in sn.findall("m:executions/m:execution", POM_NS):
-            exec_id = exec_node.findtext("m:id", default="", namespaces=POM_NS)
-            # Only include executions with explicit <test> selection
-            test_spec = exec_node.findtext("m:configuration/m:test", default="", namespaces=POM_NS)
-            if exec_id and test_spec:
-                executions.append(FuzzExecution(exec_id, test_spec, surefire_version, profile_id))
+    # Only include executions with explicit <test> selection
+    executions = [FuzzExecution(eid, spec, surefire_version, profile_id) for eid, spec in specs if eid and spec]
     if not executions:
         raise RuntimeError("No fuzz executions with <test> found in fuzz profile")
     return executions
 
 
+def read_pom_fork_env(pom_path: Path, profile_id: str) -> Dict[str, str]:
+    # Raw <environmentVariables> of the profile's surefire plugin, i.e. what the forked
+    # test JVM gets on top of (and overriding) the inherited environment
+    ET = _xml_etree()
+    path: List[str] = []
+    cur_profile_id = ""
+    artifact_id = ""
+    plugin_env: Dict[str, str] = {}
+    profile_env: Dict[str, str] = {}
+    fork_env: Optional[Dict[str, str]] = None
+
+    for event, elem in ET.iterparse(str(pom_path), events=("start", "end")):
+        if event == "start":
+            path.append(elem.tag.rsplit("}", 1)[-1])
+            continue
+        here = tuple(path)
+        parent, name = here[:-1], here[-1]
+        if parent == _PROFILE and name == "id":
+            cur_profile_id = (elem.text or "").strip()
+        elif parent == _PLUGIN and name == "artifactId":
+            artifact_id = (elem.text or "").strip()
+        elif parent == _PLUGIN_ENV:
+            plugin_env[name] = (elem.text or "").strip()
+        elif here == _PLUGIN:
+            if artifact_id == "maven-surefire-plugin":
+                profile_env = plugin_env
+            artifact_id = ""
+            plugin_env = {}
+        elif here == _PROFILE:
+            if cur_profile_id == profile_id and fork_env is None:
+                fork_env = profile_env
+            cur_profile_id = ""
+            profile_env = {}
+        path.pop()
+        elem.clear()
+    return fork_env or {}
+
+
 def filter_executions(execs: List[FuzzExecution], pattern: Optional[str]) -> List[FuzzExecution]:
     if not pattern:
         return execs
@@ -152,6 +308,72 @@ def filter_executions(execs: List[FuzzExecution], pattern: Optional[str]) -> Lis
     return out
 
 
+def shard_executions(execs: List[FuzzExecution], index: int, count: int) -> List[FuzzExecution]:
+    # Deterministic regardless of pom.xml order: every shard sees the same sorted list
+    ordered = sorted(execs, key=lambda e: e.execution_id)
+    return [e for i, e in enumerate(ordered) if i % count == index - 1]
+
+
+def batch_by_class(execs: List[FuzzExecution]) -> List[FuzzExecution]:
+    # Merge executions of the same test class into one Surefire run (Class#m1+m2+...)
+    groups: Dict[str, List[FuzzExecution]] = {}
+    for e in execs:
+        groups.setdefault(e.test_class or e.test_spec, []).append(e)
+    out: List[FuzzExecution] = []
+    for test_class, group in groups.items():
+        if len(group) < 2 or any(not e.test_method for e in group):
+            out.extend(group)
+            continue
+        first = group[0]
+        spec = test_class + "#" + "+".join(e.test_method for e in group)
+        out.append(FuzzExecution(f"{test_class}__batched", spec, first.surefire_version, first.profile_id, members=group))
+    return out
+
+
+def read_surefire_outcomes(report_dir: Path, test_class: str) -> Dict[str, str]:
+    # Map test method name -> passed/failed/skipped from Surefire XML reports
+    outcomes: Dict[str, str] = {}
+    rank = {"passed": 0, "skipped": 1, "failed": 2}
+    ET = _xml_etree()
+    for xml_path in sorted(report_dir.glob("TEST-*.xml")):
+        try:
+            root = ET.parse(str(xml_path)).getroot()
+        except (ET.ParseError, OSError):
+            continue
+        for case in root.iter("testcase"):
+            if case.get("classname") != test_class:
+                continue
+            # Template invocations are reported as e.g. "method{...}[1]" or "method(...)"
+            name = re.split(r"[\[({ ]", case.get("name", ""), maxsplit=1)[0]
+            if case.find("failure") is not None or case.find("error") is not None:
+                status = "failed"
+            elif case.find("skipped") is not None:
+                status = "skipped"
+            else:
+                status = "passed"
+            if rank[status] >= rank.get(outcomes.get(name, "passed"), 0):
+                outcomes[name] = status
+    return outcomes
+
+
+def expand_batched_result(result: JobResult) -> List[JobResult]:
+    # Split a batched job back into one row per original execution
+    execution = result.execution
+    outcomes: Dict[str, str] = {}
+    if result.surefire_report_dir.is_dir():
+        outcomes = read_surefire_outcomes(result.surefire_report_dir, execution.test_class or "")
+    expanded = []
+    for member in execution.members:
+        # A member absent from the reports never ran: it only inherits a failed or
+        # cancelled batch, a batch that otherwise passed does not make it pass
+        missing = "skipped" if result.status == "passed" else result.status
+        status = outcomes.get(member.test_method or "", missing)
+        if result.status == "cancelled":
+            status = "cancelled"
+        expanded.append(dataclasses.replace(result, execution=member, status=status, tail=collections.deque(result.tail, maxlen=TAIL_LINES)))
+    return expanded
+
+
 def detect_mvnw(base_dir: Path) -> Path:
     mvnw = base_dir / "mvnw"
     if mvnw.exists():
@@ -162,76 +384,349 @@ def detect_mvnw(base_dir: Path) -> Path:
     raise RuntimeError("Neither ./mvnw nor mvn found in PATH")
 
 
+@functools.cache
+def detect_mvnw_cached(base_dir_str: str) -> Tuple[Path, str]:
+    # Probe once per base dir; callers get the str form ready for command lines
+    mvnw = detect_mvnw(Path(base_dir_str))
+    return mvnw, str(mvnw)
+
+
+# Entries of the project tree that are never shared with a job's work dir
+WORKSPACE_IGNORE = (".git", ".idea", "target", "fuzz-out")
+WORKSPACE_MODES = ("copy", "symlink", "overlay")
+
+
+def _workspace_ignored(name: str) -> bool:
+    return name in WORKSPACE_IGNORE or name.startswith("hs_err_pid") or name.startswith("crash-")
+
+
+def _mount_overlay(base_dir: Path, work_dir: Path) -> Optional[str]:
+    # Returns None once mounted, else why not; callers fall back to the symlink farm
+    if not sys.platform.startswith("linux") or not hasattr(os, "geteuid") or os.geteuid() != 0:
+        return "overlayfs needs root on Linux"
+    job_root = work_dir.parent
+    upper = job_root / "overlay-upper"
+    scratch = job_root / "overlay-work"
+    for d in (upper, scratch):
+        if d.exists():
+            shutil.rmtree(d)
+        d.mkdir(parents=True)
+    # Hide build outputs and previous runs of the shared tree with whiteouts (0/0 char devices)
+    for name in os.listdir(base_dir):
+        if _workspace_ignored(name):
+            os.mknod(upper / name, stat.S_IFCHR | 0o600, os.makedev(0, 0))
+    work_dir.mkdir(parents=True)
+    opts = f"lowerdir={base_dir},upperdir={upper},workdir={scratch}"
+    try:
+        proc = subprocess.run(
+            ["mount", "-t", "overlay", "overlay", "-o", opts, str(work_dir)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="replace",
+        )
+        error = None if proc.returncode == 0 else proc.stderr.strip() or f"mount exited with code {proc.returncode}"
+    except OSError as e:
+        error = str(e)
+    if error is not None:
+        # Leave nothing behind that could be mistaken for the job's outputs
+        work_dir.rmdir()
+        for d in (upper, scratch):
+            shutil.rmtree(d, ignore_errors=True)
+    return error
+
+
+# The overlay fallback is reported once per run, not once per job
+_overlay_fallback_reported = False
 
-async def stream_process(cmd: List[str], cwd: Path, env: Dict[str, str], log_file: Path, result: JobResult):
-    # Capture combined stdout/err
-    proc = await asyncio.create_subprocess_exec(
-        *cmd,
-        cwd=str(cwd),
-        env=env,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.STDOUT,
-    )
-    result.start_time = time.time()
-    result.status = "running"
 
-    # Simple tail of last N lines for status
-    tail_max = 8
-    last_lines: List[str] = []
+COPY_BUFSIZE = 1024 * 1024
 
-    # Ensure log dir
+
+def _copy_fd(src_fd: int, dst_fd: int) -> None:
+    # In-kernel copy where possible, then sendfile, then a plain buffered loop
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None:
+        try:
+            while copy_file_range(src_fd, dst_fd, COPY_BUFSIZE):
+                pass
+            return
+        except OSError:
+            pass  # e.g. cross-device copy on older kernels
+    if hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+        try:
+            offset = os.lseek(src_fd, 0, os.SEEK_CUR)
+            while True:
+                sent = os.sendfile(dst_fd, src_fd, offset, COPY_BUFSIZE)
+                if not sent:
+                    return
+                offset += sent
+        except OSError:
+            pass
+    # Restart from scratch so a failed fast path leaves no partial data behind
+    os.lseek(src_fd, 0, os.SEEK_SET)
+    os.lseek(dst_fd, 0, os.SEEK_SET)
+    os.ftruncate(dst_fd, 0)
+    while True:
+        chunk = os.read(src_fd, COPY_BUFSIZE)
+        if not chunk:
+            return
+        view = memoryview(chunk)
+        while view:
+            view = view[os.write(dst_fd, view):]
+
+
+def _copy_file_fast(src: str, dst: str, st: os.stat_result) -> None:
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            _copy_fd(src_fd, dst_fd)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    # Keep permission bits (mvnw must stay executable) and timestamps like shutil.copy2
+    os.chmod(dst, stat.S_IMODE(st.st_mode))
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def copy_tree_fast(src_root: Path, dst_root: Path, ignore=_workspace_ignored) -> None:
+    """Recursive copy with os.scandir and in-kernel file copies; follows symlinks like shutil.copytree."""
+    stack = [(str(src_root), str(dst_root))]
+    while stack:
+        src_dir, dst_dir = stack.pop()
+        os.makedirs(dst_dir, exist_ok=True)
+        with os.scandir(src_dir) as it:
+            for entry in it:
+                if ignore is not None and ignore(entry.name):
+                    continue
+                dst = os.path.join(dst_dir, entry.name)
+                if entry.is_dir():
+                    stack.append((entry.path, dst))
+                else:
+                    _copy_file_fast(entry.path, dst, entry.stat())
+
+
+def prepare_workspace(base_dir: Path, work_dir: Path, mode: str) -> str:
+    """Populate work_dir from base_dir and return the mode actually used.
+
+    copy:    full copy of the project tree (slow, fully isolated)
+    symlink: top-level entries are symlinked to base_dir; only target/ is a real directory
+    overlay: overlayfs mount with a per-job upper dir (root on Linux only, else symlink);
+             the kernel refuses layers nested in each other, so --out-dir must live outside base_dir
+    """
+    release_workspace(work_dir)
+    if work_dir.exists():
+        shutil.rmtree(work_dir)
+
+    if mode == "overlay":
+        error = _mount_overlay(base_dir, work_dir)
+        if error is None:
+            (work_dir / "target").mkdir(exist_ok=True)
+            return "overlay"
+        global _overlay_fallback_reported
+        if not _overlay_fallback_reported:
+            _overlay_fallback_reported = True
+            print(f"Warning: overlay mount failed ({error}), using symlink workspaces", file=sys.stderr)
+        mode = "symlink"
+
+    if mode == "copy":
+        copy_tree_fast(base_dir, work_dir)
+    else:
+        work_dir.mkdir(parents=True)
+        for entry in base_dir.iterdir():
+            if not _workspace_ignored(entry.name):
+                os.symlink(entry, work_dir / entry.name, target_is_directory=entry.is_dir())
+    (work_dir / "target").mkdir(exist_ok=True)
+    return mode
+
+
+def release_workspace(work_dir: Path) -> None:
+    # Unmount a leftover overlay so the work dir can be removed safely
+    if os.path.ismount(work_dir):
+        subprocess.run(["umount", str(work_dir)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+
+# Environment variables that only apply to fuzzing runs
+FUZZ_ENV_KEYS = ("JAZZER_FUZZ", "JAZZER_FLAGS", "ASAN_OPTIONS", "JAVA_TOOL_OPTIONS")
+
+# On POSIX, child environments are kept as bytes (os.environb): nothing is decoded up front
+# and subprocess does not have to re-encode every variable for each job
+Env = Union[Dict[str, str], Dict[bytes, bytes]]
+env_enc = os.fsencode if os.supports_bytes_environ else str
+_FUZZ_ENV_KEYS_ENC = frozenset(env_enc(k) for k in FUZZ_ENV_KEYS)
+
+
+def environ_snapshot() -> Env:
+    return dict(os.environb) if os.supports_bytes_environ else dict(os.environ)
+
+# How much of the end of a log is re-read to refresh a job's status tail
+TAIL_BYTES = 8192
+# Number of log lines kept per job for the status display
+TAIL_LINES = 8
+
+
+def read_log_tail(fd: int, tail: Deque[bytes]) -> None:
+    size = os.fstat(fd).st_size
+    offset = max(0, size - TAIL_BYTES)
+    if hasattr(os, "pread"):
+        chunk = os.pread(fd, TAIL_BYTES, offset)
+    else:
+        os.lseek(fd, offset, os.SEEK_SET)
+        chunk = os.read(fd, TAIL_BYTES)
+    lines = chunk.splitlines()
+    if offset:
+        # First line is most likely cut in the middle
+        lines = lines[1:]
+    # The deque's maxlen keeps only the newest lines
+    tail.clear()
+    tail.extend(line for line in lines if line.strip())
+
+
+async def stream_process(cmd: List[str], cwd: Path, env: Env, log_file: Path, result: JobResult, refresh: float = 1.0):
+    # The child writes combined stdout/err straight into the log file, so no
+    # output passes through Python; the status tail is refreshed from the file.
+    # With no pipe in between there is no StreamReader limit or pipe buffer to
+    # size: a burst of fuzzer output never blocks the child on a full pipe.
     log_file.parent.mkdir(parents=True, exist_ok=True)
-    with log_file.open("wb") as f:
+    log_fd = os.open(log_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND, 0o644)
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=str(cwd),
+            env=env,
+            stdout=log_fd,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+    finally:
+        # The child holds its own copy of the descriptor
+        os.close(log_fd)
+    result.start_time = time.time()
+    result.status = "running"
+
+    tail_fd = os.open(log_file, os.O_RDONLY)
+    waiter = asyncio.ensure_future(proc.wait())
+    try:
         while True:
-            line = await proc.stdout.readline()
-            if not line:
+            done, _ = await asyncio.wait({waiter}, timeout=refresh)
+            read_log_tail(tail_fd, result.tail)
+            if done:
                 break
-            f.write(line)
-            # update tail
-            sline = line.decode(errors="replace").rstrip()
-            last_lines.append(sline)
-            if len(last_lines) > tail_max:
-                last_lines.pop(0)
-            result.last_lines = last_lines[:]
-
-    exit_code = await proc.wait()
+    finally:
+        if not waiter.done():
+            waiter.cancel()
+        os.close(tail_fd)
+
+    exit_code = waiter.result()
     result.exit_code = exit_code
     result.end_time = time.time()
     result.status = "passed" if exit_code == 0 else "failed"
 
 
-def build_maven_command(mvnw: Path, execution: FuzzExecution, build_dir: Path, duration: str, batch: bool, rss_limit_mb: int, xmx_mb: int) -> List[str]:
-    cmd: List[str] = [str(mvnw), "-P", execution.profile_id]
+def build_warmup_command(mvnw: str, profile_id: str, surefire_version: str, shared_repo: Path, batch: bool) -> List[str]:
+    cmd: List[str] = [mvnw, "-P", profile_id]
     if batch:
         cmd += ["-B"]
-    # Enforce per-test memory limits:
-    # - libFuzzer RSS limit via JAZZER_FLAGS
-    # - ASan hard RSS limit so native allocations are capped too
-    jazzer_flags = f"-rss_limit_mb={rss_limit_mb}"
-    asan_opts = f"detect_leaks=1,abort_on_error=1,fast_unwind_on_malloc=0,hard_rss_limit_mb={rss_limit_mb}"
     cmd += [
-        f"-Djazzer.max_duration={duration}",
-        f"-Denv.JAZZER_FLAGS={jazzer_flags}",
-        f"-Denv.ASAN_OPTIONS={asan_opts}",
-        # Constrain heap of the forked Surefire JVM to avoid hitting RSS limits due to Java heap growth
-        f"-Denv.JAVA_TOOL_OPTIONS=-Xmx{xmx_mb}m",
-        f"-DargLine=-Xmx{xmx_mb}m",
-        # Run the single surefire execution by id
-        f"org.apache.maven.plugins:maven-surefire-plugin:{execution.surefire_version}:test@{execution.execution_id}",
+        f"-Dmaven.repo.local={shared_repo}",
+        # Surefire resolves its JUnit Platform provider lazily; fetch it now so jobs can run offline
+        f"-Dartifact=org.apache.maven.surefire:surefire-junit-platform:{surefire_version}",
+        "dependency:resolve",
+        "dependency:resolve-plugins",
+        "dependency:get",
+        "test-compile",
     ]
     return cmd
 
 
+async def run_warmup(cmd: List[str], cwd: Path, env: Env, log_file: Path) -> int:
+    # One-time dependency resolution and compilation shared by all jobs
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    with log_file.open("wb") as f:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=str(cwd),
+            env=env,
+            stdout=f,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        return await proc.wait()
+
+
+def seed_build_outputs(base_dir: Path, work_dir: Path) -> None:
+    # Jobs never compile; they share the classes produced by the warmup run. Only these
+    # two are links, reports/findings under target/ stay private to the job
+    for name in ("classes", "test-classes"):
+        src = base_dir / "target" / name
+        if src.is_dir():
+            os.symlink(src, work_dir / "target" / name, target_is_directory=True)
+
+
+# Per-test arguments of a fuzz invocation, filled in with str.format_map. Memory limits:
+# - libFuzzer RSS limit via JAZZER_FLAGS
+# - ASan hard RSS limit so native allocations are capped too
+# - heap of the forked Surefire JVM, to avoid hitting RSS limits due to Java heap growth
+_MVN_FUZZ_TEMPLATE = (
+    "-Djazzer.max_duration={duration}",
+    "-Denv.JAZZER_FLAGS=-rss_limit_mb={rss}",
+    "-Denv.ASAN_OPTIONS=detect_leaks=1,abort_on_error=1,fast_unwind_on_malloc=0,hard_rss_limit_mb={rss}",
+    "-Denv.JAVA_TOOL_OPTIONS=-Xmx{xmx}m",
+    "-DargLine=-Xmx{xmx}m",
+)
+# Run the single surefire execution by id
+_MVN_SUREFIRE_EXECUTION = ("org.apache.maven.plugins:maven-surefire-plugin:{sv}:test@{eid}",)
+# Batched run: select all methods of the class via -Dtest in a single fork. Jazzer fuzzes
+# only one @FuzzTest per JVM, so the fork runs in regression mode (the pom maps JAZZER_FUZZ to ${jazzer.fuzz})
+_MVN_SUREFIRE_BATCHED = ("-Djazzer.fuzz=0", "-Dtest={spec}", "org.apache.maven.plugins:maven-surefire-plugin:{sv}:test")
+
+
+def build_maven_command(
+    mvnw: str,
+    execution: FuzzExecution,
+    build_dir: Path,
+    duration: str,
+    batch: bool,
+    rss_limit_mb: int,
+    xmx_mb: int,
+    shared_repo: Optional[Path] = None,
+    offline: bool = True,
+) -> List[str]:
+    params = {
+        "duration": duration,
+        "rss": rss_limit_mb,
+        "xmx": xmx_mb,
+        "sv": execution.surefire_version,
+        "eid": execution.execution_id,
+        "spec": execution.test_spec,
+    }
+    goal = _MVN_SUREFIRE_BATCHED if execution.members else _MVN_SUREFIRE_EXECUTION
+    return [
+        mvnw, "-P", execution.profile_id,
+        *(["-B"] if batch else []),
+        # Everything was resolved into the shared repository by the warmup run
+        *([f"-Dmaven.repo.local={shared_repo}"] if shared_repo is not None else []),
+        *(["-o"] if shared_repo is not None and offline else []),
+        *(arg.format_map(params) for arg in _MVN_FUZZ_TEMPLATE),
+        *(arg.format_map(params) for arg in goal),
+    ]
+
+
 async def run_job(
     base_dir: Path,
-    mvnw: Path,
+    mvnw: str,
     execution: FuzzExecution,
     duration: str,
-    env_base: Dict[str, str],
+    env_base: Env,
     batch: bool,
     result: JobResult,
     rss_limit_mb: int,
     xmx_mb: int,
+    workspace_mode: str = "symlink",
+    shared_repo: Optional[Path] = None,
+    offline: bool = True,
+    refresh: float = 1.0,
 ) -> JobResult:
     # result is pre-populated with paths for this execution
     result.status = "queued"
@@ -239,63 +734,91 @@ async def run_job(
     # Prepare environment
     env = dict(env_base)
     # Ensure findings go per-job
-    env["JAZZER_FINDINGS_DIR"] = str(result.findings_dir)
+    env[env_enc("JAZZER_FINDINGS_DIR")] = env_enc(str(result.findings_dir))
     # Reinforce JAZZER_FUZZ=1 (pom also sets it, but merge-in is fine)
-    env.setdefault("JAZZER_FUZZ", "1")
+    env.setdefault(env_enc("JAZZER_FUZZ"), env_enc("1"))
     # Enforce libFuzzer per-test RSS limit (1 GiB default, configurable)
-    env["JAZZER_FLAGS"] = f"-rss_limit_mb={rss_limit_mb}"
+    env[env_enc("JAZZER_FLAGS")] = env_enc(f"-rss_limit_mb={rss_limit_mb}")
 
     # Prepare isolated working copy per job to eliminate cross-run interference
-    job_root = Path(str(result.log_path)).parent  # job_dir
-    work_dir = job_root / "work"
+    paths = result.paths
+    # Filesystem work runs in a thread so it does not stall the event loop
+    mode = await asyncio.to_thread(prepare_workspace, base_dir, paths.work_dir, workspace_mode)
 
-    # Always refresh from the current repository state so changes are visible in isolated runs
-    def _ignore(src_dir, names):
-        ignored = {n for n in names if n in (".git", ".idea", "target", "fuzz-out")}
-        ignored |= {n for n in names if n.startswith("hs_err_pid") or n.startswith("crash-")}
-        return ignored
+    try:
+        await asyncio.to_thread(seed_build_outputs, base_dir, paths.work_dir)
 
-    if work_dir.exists():
-        shutil.rmtree(work_dir)
-    shutil.copytree(str(base_dir), str(work_dir), ignore=_ignore)
+        # Surefire execution with fuzz env and limits
+        cmd = build_maven_command(
+            mvnw, execution, paths.target_dir, duration, batch, rss_limit_mb, xmx_mb,
+            shared_repo=shared_repo, offline=offline,
+        )
+        result.command = cmd
+
+        try:
+            await stream_process(cmd, paths.work_dir, env, paths.log_path, result, refresh=refresh)
+        except asyncio.CancelledError:
+            result.status = "cancelled"
+            result.end_time = time.time()
+            # Try to annotate log
+            with result.log_path.open("a", encoding="utf-8", errors="replace") as f:
+                f.write("\n\n[Cancelled]\n")
+            raise
+        except Exception:
+            result.status = "failed"
+            result.end_time = time.time()
+            import traceback
+            with result.log_path.open("a", encoding="utf-8", errors="replace") as f:
+                f.write("\n\n[Runner Exception]\n")
+                f.write(traceback.format_exc())
+    finally:
+        if mode == "overlay":
+            # Build outputs of an overlay job survive the unmount in its upper dir
+            await asyncio.to_thread(release_workspace, paths.work_dir)
+            target_dir = paths.job_root / "overlay-upper" / "target"
+            result.paths = dataclasses.replace(paths, target_dir=target_dir, surefire_report_dir=target_dir / "surefire-reports")
+    return result
 
-    # Reset result directories to the isolated work dir target
-    result.build_dir = work_dir / "target"
-    result.surefire_report_dir = result.build_dir / "surefire-reports"
 
-    # 1) compile step without fuzz env or memory limits
-    env_compile = dict(env_base)
-    for k in ["JAZZER_FUZZ", "JAZZER_FLAGS", "ASAN_OPTIONS", "JAVA_TOOL_OPTIONS"]:
-        env_compile.pop(k, None)
-    cmd_compile = [str(mvnw), "-P", execution.profile_id]
-    if batch:
-        cmd_compile += ["-B"]
-    cmd_compile += ["test-compile"]
-    result.command = cmd_compile
-    await stream_process(cmd_compile, work_dir, env_compile, result.log_path, result)
-    if result.exit_code != 0:
-        return result
+class MemorySemaphore:
+    """Counting semaphore where each holder takes a number of memory slots."""
+
+    def __init__(self, tokens: int):
+        self.total = tokens
+        self.available = tokens
+        self._cond = asyncio.Condition()
 
-    # 2) surefire execution with fuzz env and limits
-    cmd = build_maven_command(mvnw, execution, result.build_dir, duration, batch, rss_limit_mb, xmx_mb)
-    result.command = cmd
+    async def acquire(self, tokens: int = 1) -> int:
+        # Never ask for more than exists, or the job could wait forever
+        tokens = min(tokens, self.total)
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.available >= tokens)
+            self.available -= tokens
+        return tokens
 
+    async def release(self, tokens: int = 1) -> None:
+        async with self._cond:
+            self.available += tokens
+            self._cond.notify_all()
+
+
+def available_ram_mb() -> Optional[int]:
+    if psutil is not None:
+        return psutil.virtual_memory().available // (1024 * 1024)
+    # Same figure as psutil on Linux: MemAvailable counts reclaimable page cache, unlike
+    # MemFree (SC_AVPHYS_PAGES), which is small on any host with a warm cache
     try:
-        await stream_process(cmd, work_dir, env, result.log_path, result)
-    except asyncio.CancelledError:
-        result.status = "cancelled"
-        result.end_time = time.time()
-        # Try to annotate log
-        with result.log_path.open("a", encoding="utf-8", errors="replace") as f:
-            f.write("\n\n[Cancelled]\n")
-        raise
-    except Exception:
-        result.status = "failed"
-        result.end_time = time.time()
-        with result.log_path.open("a", encoding="utf-8", errors="replace") as f:
-            f.write("\n\n[Runner Exception]\n")
-            f.write(traceback.format_exc())
-    return result
+        with open("/proc/meminfo", "rb") as f:
+            for line in f:
+                if line.startswith(b"MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    # Elsewhere, total physical memory
+    try:
+        return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        return None
 
 
 def human_duration(seconds: float) -> str:
@@ -314,6 +837,22 @@ def now_iso() -> str:
     return dt.datetime.now(dt.timezone.utc).astimezone().isoformat()
 
 
+@functools.cache
+def _local_tz() -> dt.tzinfo:
+    # Looked up once per run instead of for every timestamp
+    return dt.datetime.now().astimezone().tzinfo
+
+
+def iso_from_ts(ts: float) -> str:
+    return dt.datetime.fromtimestamp(ts, _local_tz()).isoformat()
+
+
+def dump_report_json(report_json: Dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(report_json, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(report_json, indent=2).encode("utf-8")
+
+
 async def status_printer(results: Dict[str, JobResult], start_time: float, refresh: float = 1.0):
     spinner = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
     i = 0
@@ -339,7 +878,7 @@ async def status_printer(results: Dict[str, JobResult], start_time: float, refre
         running_rows = sorted(running_rows, key=lambda kv: kv[1].start_time or 0.0)
         for key, r in running_rows[:5]:  # show up to 5
             elapsed_r = human_duration((time.time() - (r.start_time or time.time())))
-            tail = (" | ".join(r.last_lines[-last_lines_to_show:])) if r.last_lines else ""
+            tail = (" | ".join(r.last_lines[-last_lines_to_show:])) if r.tail else ""
             lines.append(f"  - {r.execution.execution_id} [{elapsed_r}] {tail}")
 
         # Use stderr to avoid mixing with per-process stdout capture and keep simple
@@ -358,22 +897,28 @@ def make_report_json(
     mvn_cmd: str,
     out_dir: Path,
     base_dir: Path,
+    shard: Optional[Tuple[int, int]] = None,
 ) -> Dict:
     total = len(results)
-    passed = sum(1 for r in results.values() if r.status == "passed")
-    failed = sum(1 for r in results.values() if r.status == "failed")
-    cancelled = sum(1 for r in results.values() if r.status == "cancelled")
+    counts = collections.Counter(r.status for r in results.values())
     start_ts = min((r.start_time or time.time()) for r in results.values()) if results else time.time()
     end_ts = max((r.end_time or time.time()) for r in results.values()) if results else time.time()
 
-    # helper to relativize paths
+    # helper to relativize paths; job paths live under base_dir, so a prefix
+    # slice covers the common case and relpath only handles the rest
+    base_str = str(base_dir)
+    base_prefix = base_str + os.sep
+
     def rel(p: Optional[Path]) -> Optional[str]:
         if not p:
             return None
+        s = str(p)
+        if s.startswith(base_prefix):
+            return s[len(base_prefix):]
         try:
-            return os.path.relpath(str(p), start=str(base_dir))
-        except Exception:
-            return str(p)
+            return os.path.relpath(s, start=base_str)
+        except ValueError:
+            return s
 
     tests = []
     for k, r in sorted(results.items()):
@@ -384,11 +929,11 @@ def make_report_json(
             "method": r.execution.test_method,
             "status": r.status,
             "exit_code": r.exit_code,
-            "started_at": dt.datetime.fromtimestamp(r.start_time or 0, tz=dt.timezone.utc).astimezone().isoformat() if r.start_time else None,
-            "ended_at": dt.datetime.fromtimestamp(r.end_time or 0, tz=dt.timezone.utc).astimezone().isoformat() if r.end_time else None,
+            "started_at": iso_from_ts(r.start_time) if r.start_time else None,
+            "ended_at": iso_from_ts(r.end_time) if r.end_time else None,
             "duration_seconds": (r.end_time - r.start_time) if (r.end_time and r.start_time) else None,
             "build_dir": rel(r.build_dir),
-            "surefire_report_dir": rel(r.surefire_report_dir) if r.surefire_report_dir else None,
+            "surefire_report_dir": rel(r.surefire_report_dir),
             "findings_dir": rel(r.findings_dir),
             "log_path": rel(r.log_path),
             "command": r.command,
@@ -401,39 +946,43 @@ def make_report_json(
         "jazzer_duration": duration,
         "concurrency": concurrency,
         "maven_command": mvn_cmd,
-        "out_dir": os.path.relpath(str(out_dir), start=str(base_dir)),
+        # "I/N" when this report covers one shard, so per-shard reports can be merged
+        "shard": f"{shard[0]}/{shard[1]}" if shard else None,
+        "out_dir": rel(out_dir),
         "summary": {
             "total": total,
-            "passed": passed,
-            "failed": failed,
-            "cancelled": cancelled,
+            "passed": counts["passed"],
+            "failed": counts["failed"],
+            "cancelled": counts["cancelled"],
+            "skipped": counts["skipped"],
             "duration_seconds": end_ts - start_ts if total else 0,
         },
         "tests": tests,
     }
 
 
-def make_report_html(report_json: Dict) -> str:
-    # Embed JSON and a tiny viewer
-    data_js = "window.REPORT = " + json.dumps(report_json, indent=2) + ";"
-    html_doc = f"""<!DOCTYPE html>
+_REPORT_HTML_HEAD = """<!DOCTYPE html>
 <html>
 <head>
   <meta charset="utf-8">
   <title>Fuzz Report</title>
   <style>
-    body {{ font-family: system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial, sans-serif; margin: 20px; }}
-    .summary {{ margin-bottom: 16px; }}
-    table {{ border-collapse: collapse; width: 100%; }}
-    th, td {{ padding: 6px 8px; border-bottom: 1px solid #ddd; text-align: left; font-size: 13px; }}
-    tr:hover {{ background: #fafafa; }}
-    .status-passed {{ color: #0a0; font-weight: 600; }}
-    .status-failed {{ color: #a00; font-weight: 600; }}
-    .status-cancelled {{ color: #a60; font-weight: 600; }}
-    code {{ background: #f5f5f5; padding: 2px 4px; border-radius: 3px; }}
-    .small {{ color: #666; font-size: 12px; }}
-    .filter {{ margin-bottom: 10px; }}
-    .nowrap {{ white-space: nowrap; }}
+    body { font-family: system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial, sans-serif; margin: 20px; }
+    .summary { margin-bottom: 16px; }
+    .scroller { max-height: 75vh; overflow: auto; border-top: 1px solid #ddd; }
+    table { border-collapse: collapse; width: 100%; }
+    th, td { padding: 6px 8px; border-bottom: 1px solid #ddd; text-align: left; font-size: 13px; white-space: nowrap; }
+    thead th { position: sticky; top: 0; background: #fff; z-index: 1; }
+    tbody tr { height: 29px; }
+    tr:hover { background: #fafafa; }
+    .status-passed { color: #0a0; font-weight: 600; }
+    .status-failed { color: #a00; font-weight: 600; }
+    .status-cancelled { color: #a60; font-weight: 600; }
+    .status-skipped { color: #666; font-weight: 600; }
+    code { background: #f5f5f5; padding: 2px 4px; border-radius: 3px; }
+    .small { color: #666; font-size: 12px; }
+    .filter { margin-bottom: 10px; }
+    .nowrap { white-space: nowrap; }
   </style>
 </head>
 <body>
@@ -442,8 +991,10 @@ def make_report_html(report_json: Dict) -> str:
 
   <div class="filter">
     Filter: <input type="text" id="filter" placeholder="Substring in id/test/class/method/status">
+    <span class="small" id="count"></span>
   </div>
 
+  <div class="scroller" id="scroller">
   <table id="tbl">
     <thead>
       <tr>
@@ -459,77 +1010,158 @@ def make_report_html(report_json: Dict) -> str:
     </thead>
     <tbody></tbody>
   </table>
+  </div>
 
   <script>
-  {data_js}
-  function esc(s) {{
-    return (s||"").toString().replace(/[&<>"]/g, c => ({{"&":"&amp;","<":"&lt;",">":"&gt;","\\"":"&quot;"}})[c]);
-  }}
-  function humanDuration(sec) {{
-    if (!sec && sec !== 0) return "";
-    if (sec < 1) return Math.round(sec*1000) + "ms";
-    var m = Math.floor(sec/60), s = Math.floor(sec % 60), h = Math.floor(m/60); m = m % 60;
-    if (h) return h + "h" + m + "m" + s + "s";
-    if (m) return m + "m" + s + "s";
-    return s + "s";
-  }}
-  function render() {{
-    const rep = window.REPORT;
-    // Compute a prefix that navigates from the report file location (rep.out_dir/...) back to project root
-    // so that project-root-relative paths (like t.log_path) resolve correctly in the browser.
-    const prefix = (function () {{
-      const out = (rep.out_dir || "").split("/").filter(Boolean);
-      if (out.length === 0) return "";
-      let p = "";
-      for (let i = 0; i < out.length; i++) p += "../";
-      return p;
-    }})();
-    const sum = rep.summary;
-    const summaryEl = document.getElementById("summary");
-    summaryEl.innerHTML =
-      "<div><strong>Project:</strong> " + esc(rep.project) + " " +
-      "<span class='small'>(" + esc(rep.profile) + ", duration=" + esc(rep.jazzer_duration) + ", concurrency=" + rep.concurrency + ")</span></div>" +
-      "<div><strong>Total:</strong> " + sum.total +
-      " &nbsp; <span class='status-passed'>Passed:</span> " + sum.passed +
-      " &nbsp; <span class='status-failed'>Failed:</span> " + sum.failed +
-      " &nbsp; <span class='status-cancelled'>Cancelled:</span> " + sum.cancelled +
-      " &nbsp; <span class='small'>Runtime: " + humanDuration(sum.duration_seconds) + "</span></div>" +
-      "<div class='small'>Output dir: <code>" + esc(rep.out_dir) + "</code></div>";
-
-    const filter = document.getElementById("filter").value.toLowerCase();
-    const tbody = document.querySelector("#tbl tbody");
-    tbody.innerHTML = "";
-    rep.tests.forEach(t => {{
-      const hay = (t.id + " " + t.test + " " + (t.class||"") + " " + (t.method||"") + " " + t.status).toLowerCase();
-      if (filter && hay.indexOf(filter) === -1) return;
+  """.encode("utf-8")
+
+# Rows arrive pre-escaped from Python; only the rows in view (plus overscan) are in the DOM
+_REPORT_HTML_TAIL = """
+  const ROW_HEIGHT = 29, OVERSCAN = 20;
+  const scroller = document.getElementById("scroller");
+  const tbody = document.querySelector("#tbl tbody");
+  const filterEl = document.getElementById("filter");
+  let filtered = window.ROWS;
+
+  function spacer(rows) {
+    // Browsers only honor the height of a row that has a cell
+    const tr = document.createElement("tr"), td = document.createElement("td");
+    td.colSpan = 8;
+    td.style.padding = "0";
+    td.style.border = "0";
+    tr.style.height = (rows * ROW_HEIGHT) + "px";
+    tr.appendChild(td);
+    return tr;
+  }
+  function renderWindow() {
+    const visible = Math.ceil(scroller.clientHeight / ROW_HEIGHT) || 1;
+    const first = Math.min(Math.floor(scroller.scrollTop / ROW_HEIGHT), Math.max(0, filtered.length - visible));
+    const last = Math.min(filtered.length, first + visible + OVERSCAN);
+    const frag = document.createDocumentFragment();
+    if (first > 0) frag.appendChild(spacer(first));
+    for (let i = first; i < last; i++) {
       const tr = document.createElement("tr");
-      const stClass = "status-" + (t.status||"unknown");
-      // Build href relative to the report directory: if log_path starts with out_dir/, strip it; else prefix up to root.
-      const href = (function () {{
-        const p = t.log_path || "";
-        const r = rep.out_dir || "";
-        if (r && p.startsWith(r + "/")) return p.slice(r.length + 1);
-        return prefix + p;
-      }})();
-      tr.innerHTML =
-        "<td class='" + stClass + " nowrap'>" + esc(t.status) + "</td>" +
-        "<td class='nowrap'>" + esc(t.id) + "</td>" +
-        "<td><code>" + esc(t.test) + "</code></td>" +
-        "<td class='nowrap'>" + humanDuration(t.duration_seconds) + "</td>" +
-        "<td><code>" + esc(t.build_dir || "") + "</code></td>" +
-        "<td>" + (t.log_path ? ("<a href='" + esc(href) + "' target='_blank'>build.log</a>") : "") + "</td>" +
-        "<td><code>" + esc(t.findings_dir || "") + "</code></td>" +
-        "<td><code>" + esc(t.surefire_report_dir || "") + "</code></td>";
-      tbody.appendChild(tr);
-    }});
-  }}
-  document.getElementById("filter").addEventListener("input", render);
-  render();
+      tr.innerHTML = filtered[i].html;
+      frag.appendChild(tr);
+    }
+    if (last < filtered.length) frag.appendChild(spacer(filtered.length - last));
+    tbody.replaceChildren(frag);
+  }
+  function applyFilter() {
+    const filter = filterEl.value.toLowerCase();
+    filtered = filter ? window.ROWS.filter(r => r.hay.indexOf(filter) !== -1) : window.ROWS;
+    document.getElementById("count").textContent = filtered.length + " / " + window.ROWS.length;
+    scroller.scrollTop = 0;
+    renderWindow();
+  }
+  let filterTimer = null, scrollPending = false;
+  filterEl.addEventListener("input", () => {
+    clearTimeout(filterTimer);
+    filterTimer = setTimeout(applyFilter, 50);
+  });
+  scroller.addEventListener("scroll", () => {
+    if (scrollPending) return;
+    scrollPending = true;
+    requestAnimationFrame(() => { scrollPending = false; renderWindow(); });
+  });
+  document.getElementById("summary").innerHTML = window.SUMMARY_HTML;
+  applyFilter();
   </script>
 </body>
 </html>
-"""
-    return html_doc
+""".encode("utf-8")
+
+
+def _report_html_rows(report_json: Dict) -> Tuple[str, List[Dict[str, str]]]:
+    # Escape once here instead of on every render in the browser
+    import html
+    esc = html.escape
+    out_dir = report_json.get("out_dir") or ""
+    # Navigate from the report file location (out_dir/...) back to the project root so that
+    # project-root-relative paths (like log_path) resolve correctly in the browser
+    prefix = "../" * len([p for p in out_dir.split("/") if p])
+
+    def dur(sec: Optional[float]) -> str:
+        return human_duration(sec) if sec is not None else ""
+
+    sm = report_json["summary"]
+    summary_html = (
+        f"<div><strong>Project:</strong> {esc(str(report_json['project']))} "
+        f"<span class='small'>({esc(str(report_json['profile']))}, duration={esc(str(report_json['jazzer_duration']))}, concurrency={report_json['concurrency']})</span></div>"
+        f"<div><strong>Total:</strong> {sm['total']}"
+        f" &nbsp; <span class='status-passed'>Passed:</span> {sm['passed']}"
+        f" &nbsp; <span class='status-failed'>Failed:</span> {sm['failed']}"
+        f" &nbsp; <span class='status-cancelled'>Cancelled:</span> {sm['cancelled']}"
+        + (f" &nbsp; <span class='status-skipped'>Skipped:</span> {sm['skipped']}" if sm.get("skipped") else "")
+        + f" &nbsp; <span class='small'>Runtime: {dur(sm['duration_seconds'])}</span></div>"
+        f"<div class='small'>Output dir: <code>{esc(out_dir)}</code></div>"
+    )
+
+    rows = []
+    for t in report_json["tests"]:
+        status = t["status"] or "unknown"
+        log_path = t["log_path"] or ""
+        # Link relative to the report directory: strip out_dir/ if possible, else go up to the root
+        href = log_path[len(out_dir) + 1:] if out_dir and log_path.startswith(out_dir + "/") else prefix + log_path
+        log_link = f"<a href='{esc(href)}' target='_blank'>build.log</a>" if log_path else ""
+        cells = (
+            f"<td class='status-{esc(status)} nowrap'>{esc(status)}</td>"
+            f"<td class='nowrap'>{esc(t['id'])}</td>"
+            f"<td><code>{esc(t['test'])}</code></td>"
+            f"<td class='nowrap'>{dur(t['duration_seconds'])}</td>"
+            f"<td><code>{esc(t['build_dir'] or '')}</code></td>"
+            f"<td>{log_link}</td>"
+            f"<td><code>{esc(t['findings_dir'] or '')}</code></td>"
+            f"<td><code>{esc(t['surefire_report_dir'] or '')}</code></td>"
+        )
+        hay = " ".join((t["id"], t["test"], t["class"] or "", t["method"] or "", status)).lower()
+        rows.append({"hay": hay, "html": cells})
+    return summary_html, rows
+
+
+def make_report_html(report_json: Dict) -> bytes:
+    # Embed the pre-rendered summary and rows with a tiny virtualized viewer; the raw
+    # report lives next to it as JSON and is not duplicated here
+    summary_html, rows = _report_html_rows(report_json)
+
+    def js(value) -> bytes:
+        # "</" would end the <script> element early
+        return json.dumps(value).replace("</", "<\\/").encode("utf-8")
+
+    data = b"".join([
+        b"window.SUMMARY_HTML = ", js(summary_html), b";\n",
+        b"  window.ROWS = ", js(rows), b";",
+    ])
+    return _REPORT_HTML_HEAD + data + _REPORT_HTML_TAIL
+
+
+def write_reports(
+    args,
+    results: Dict[str, JobResult],
+    mvn_cmd: str,
+    out_dir: Path,
+    base_dir: Path,
+    concurrency: int,
+) -> Tuple[Path, Path]:
+    project_name = "lz4-java"
+    report_json = make_report_json(
+        results=results,
+        project=project_name,
+        profile=args.profile,
+        duration=args.duration,
+        concurrency=concurrency,
+        mvn_cmd=mvn_cmd,
+        out_dir=out_dir,
+        base_dir=base_dir,
+        shard=args.shard,
+    )
+    json_path = Path(args.json_report).resolve()
+    html_path = Path(args.html_report).resolve()
+    json_path.parent.mkdir(parents=True, exist_ok=True)
+    html_path.parent.mkdir(parents=True, exist_ok=True)
+    json_path.write_bytes(dump_report_json(report_json))
+    html_path.write_bytes(make_report_html(report_json))
+    return json_path, html_path
 
 
 async def main_async(args):
@@ -538,11 +1170,12 @@ async def main_async(args):
     out_dir = Path(args.out_dir).resolve()
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    mvnw = Path(args.mvn) if args.mvn else detect_mvnw(base_dir)
-    mvn_cmd_str = str(mvnw)
+    mvn_cmd_str = args.mvn if args.mvn else detect_mvnw_cached(str(base_dir))[1]
 
     execs = read_pom_executions(pom_path, profile_id=args.profile)
     execs = filter_executions(execs, args.filter)
+    if args.shard:
+        execs = shard_executions(execs, *args.shard)
 
     if args.list:
         print(f"Detected {len(execs)} fuzz executions in profile '{args.profile}':")
@@ -554,30 +1187,78 @@ async def main_async(args):
         print("No fuzz executions after filtering.", file=sys.stderr)
         return 1
 
+    if args.workspace_mode == "overlay" and out_dir.is_relative_to(base_dir):
+        # The job mounts would sit inside their own lower layer, which the kernel refuses
+        print(f"--workspace-mode overlay needs --out-dir outside the project ({base_dir})", file=sys.stderr)
+        return 1
+
+    if args.batch_by_class:
+        # Jazzer fuzzes a single @FuzzTest per JVM and skips the rest, so batched forks
+        # must run in regression mode. Surefire's <environmentVariables> override the
+        # inherited environment; the batched command sets -Djazzer.fuzz=0 for the pom to use
+        fork_fuzz = read_pom_fork_env(pom_path, args.profile).get("JAZZER_FUZZ")
+        if fork_fuzz is None:
+            fork_fuzz = os.environ.get("JAZZER_FUZZ", "1")
+        if fork_fuzz.replace("${jazzer.fuzz}", "0") not in ("", "0"):
+            print(f"--batch-by-class needs the forked JVM in regression mode, but profile '{args.profile}' "
+                  f"sets JAZZER_FUZZ={fork_fuzz}; use JAZZER_FUZZ=${{jazzer.fuzz}} in its surefire environmentVariables",
+                  file=sys.stderr)
+            return 1
+        execs = batch_by_class(execs)
+
     # Shared environment
-    env_base = dict(os.environ)
+    env_base = environ_snapshot()
+
+    # Concurrency control: each job holds enough memory slots for its forked JVM heap plus
+    # overhead, out of a pool bounded by both --jobs and the RAM currently available
+    slot_mb = max(1, args.mem_slot_mb)
+    job_tokens = max(1, -(-(args.xmx_mb + 200) // slot_mb))
+    pool_tokens = args.jobs * job_tokens
+    ram_mb = available_ram_mb()
+    if ram_mb is not None:
+        pool_tokens = max(job_tokens, min(pool_tokens, ram_mb // slot_mb))
+    # Jobs that can actually run side by side; this is what the reports record
+    concurrency = pool_tokens // job_tokens
+    if concurrency < args.jobs:
+        print(f"Running {concurrency} job(s) at a time instead of {args.jobs}: {ram_mb} MB available, "
+              f"{job_tokens * slot_mb} MB reserved per job (--xmx-mb + 200, in --mem-slot-mb slots)", file=sys.stderr)
+
+    # Resolve dependencies and compile once into a shared local repository; jobs reuse both
+    shared_repo = out_dir / ".m2-repo"
+    # Built once: the warmup compile runs without fuzz env or memory limits
+    env_compile = {k: v for k, v in env_base.items() if k not in _FUZZ_ENV_KEYS_ENC}
+    warmup_cmd = build_warmup_command(mvn_cmd_str, args.profile, execs[0].surefire_version, shared_repo, not args.no_batch)
+    warmup_log = out_dir / "warmup.log"
+    print(f"Resolving dependencies and compiling once (log: {warmup_log})", file=sys.stderr)
+    warmup_start = time.time()
+    rc = await run_warmup(warmup_cmd, base_dir, env_compile, warmup_log)
+    if rc != 0:
+        print(f"Warmup build failed with exit code {rc}, see {warmup_log}", file=sys.stderr)
+        # Still write the reports: every execution fails with the warmup log as its log
+        failed_results = {}
+        for e in (m for ex in execs for m in (ex.members or [ex])):
+            paths = dataclasses.replace(JobPaths.for_execution(out_dir, e.execution_id), log_path=warmup_log)
+            failed_results[e.execution_id] = JobResult(
+                status="failed", execution=e, paths=paths, start_time=warmup_start,
+                end_time=time.time(), exit_code=rc, command=warmup_cmd,
+            )
+        write_reports(args, failed_results, mvn_cmd_str, out_dir, base_dir, concurrency)
+        return 1
 
     # Prepare jobs map
     results: Dict[str, JobResult] = {
-        e.execution_id: JobResult(
-            status="queued",
-            execution=e,
-            build_dir=out_dir / sanitize_for_path(e.execution_id) / "target",
-            findings_dir=out_dir / sanitize_for_path(e.execution_id) / "findings",
-            log_path=out_dir / sanitize_for_path(e.execution_id) / "build.log",
-            surefire_report_dir=out_dir / sanitize_for_path(e.execution_id) / "target" / "surefire-reports",
-        )
+        e.execution_id: JobResult(status="queued", execution=e, paths=JobPaths.for_execution(out_dir, e.execution_id))
         for e in execs
     }
 
-    # Concurrency control
-    sem = asyncio.Semaphore(args.jobs)
+    sem = MemorySemaphore(pool_tokens)
 
     async def run_one(e: FuzzExecution):
-        async with sem:
+        held = await sem.acquire(job_tokens)
+        try:
             return await run_job(
                 base_dir=base_dir,
-                mvnw=mvnw,
+                mvnw=mvn_cmd_str,
                 execution=e,
                 duration=args.duration,
                 env_base=env_base,
@@ -585,57 +1266,87 @@ async def main_async(args):
                 result=results[e.execution_id],
                 rss_limit_mb=args.rss_limit_mb,
                 xmx_mb=args.xmx_mb,
+                workspace_mode=args.workspace_mode,
+                shared_repo=shared_repo,
+                offline=not args.no_offline,
+                refresh=args.refresh,
             )
+        finally:
+            await sem.release(held)
 
-    # Kick off tasks
     start_time = time.time()
-    loop = asyncio.get_running_loop()
-    tasks = {}
+
+    # Record each job's outcome as soon as its task finishes; the task name is the execution id
+    execs_by_id = {e.execution_id: e for e in execs}
+
+    def collect(t: asyncio.Task):
+        exec_id = t.get_name()
+        if t.cancelled():
+            # Jobs cancelled before their Maven run started never got a final status
+            res = results[exec_id]
+            if res.status in ("queued", "running"):
+                res.status = "cancelled"
+                res.end_time = res.end_time or time.time()
+            return
+        ex = t.exception()
+        if ex is None:
+            results[exec_id] = t.result()
+            return
+        # Create a failed result entry
+        res = JobResult(
+            status="failed",
+            execution=execs_by_id[exec_id],
+            paths=results[exec_id].paths,
+            start_time=start_time,
+            end_time=time.time(),
+            exit_code=-1,
+        )
+        import traceback
+        res.log_path.parent.mkdir(parents=True, exist_ok=True)
+        with res.log_path.open("a", encoding="utf-8", errors="replace") as f:
+            f.write("\n[Runner captured exception]\n")
+            f.write("".join(traceback.format_exception(ex)))
+        results[exec_id] = res
+
+    # Kick off tasks
+    tasks = []
     for e in execs:
-        task = asyncio.create_task(run_one(e))
-        tasks[e.execution_id] = task
+        task = asyncio.create_task(run_one(e), name=e.execution_id)
+        task.add_done_callback(collect)
+        tasks.append(task)
+
+    # Trap SIGINT to attempt graceful cancel: the first Ctrl-C cancels outstanding jobs so the
+    # reports are still written, a second one interrupts the runner
+    loop = asyncio.get_running_loop()
+    interrupted = False
+
+    def handle_sigint():
+        nonlocal interrupted
+        interrupted = True
+        loop.remove_signal_handler(signal.SIGINT)
+        for t in tasks:
+            t.cancel()
+
+    try:
+        loop.add_signal_handler(signal.SIGINT, handle_sigint)
+    except NotImplementedError:
+        # Windows or limited environment
+        pass
 
     # Status printer
     printer_task = asyncio.create_task(status_printer(results, start_time, refresh=args.refresh))
 
-    # As tasks finish, update results dict entries (the JobResult returned carries all details)
-    done, pending = await asyncio.wait(tasks.values(), return_when=asyncio.FIRST_COMPLETED)
-    # Replace placeholder results with real ones as they complete
-    # We will do it in a loop until all tasks done
-    while tasks:
-        done, _pending = await asyncio.wait(tasks.values(), return_when=asyncio.FIRST_COMPLETED)
-        for t in done:
-            # Find which exec this belongs to
-            exec_id = None
-            for k, v in list(tasks.items()):
-                if v is t:
-                    exec_id = k
-                    break
-            try:
-                res = t.result()
-            except Exception as ex:
-                # Create a failed result entry
-                e = next((ev for ev in execs if ev.execution_id == exec_id), None)
-                if e:
-                    res = JobResult(
-                        status="failed",
-                        execution=e,
-                        build_dir=out_dir / sanitize_for_path(e.execution_id) / "target",
-                        findings_dir=out_dir / sanitize_for_path(e.execution_id) / "findings",
-                        log_path=out_dir / sanitize_for_path(e.execution_id) / "build.log",
-                        surefire_report_dir=out_dir / sanitize_for_path(e.execution_id) / "target" / "surefire-reports",
-                        start_time=start_time,
-                        end_time=time.time(),
-                        exit_code=-1,
-                    )
-                    with res.log_path.open("a", encoding="utf-8", errors="replace") as f:
-                        f.write("\n[Runner captured exception]\n")
-                        f.write("".join(traceback.format_exception(ex)))
-                else:
-                    continue
-            if exec_id:
-                results[exec_id] = res
-                del tasks[exec_id]
+    # Wait for all jobs; failures were already turned into results by collect()
+    for fut in asyncio.as_completed(tasks):
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if not interrupted:
+                raise
+        except Exception:
+            pass
+    with contextlib_suppress(NotImplementedError, RuntimeError):
+        loop.remove_signal_handler(signal.SIGINT)
 
     # Stop status printer
     if not printer_task.done():
@@ -643,35 +1354,29 @@ async def main_async(args):
         with contextlib_suppress(asyncio.CancelledError):
             await printer_task
 
-    # Write reports
-    project_name = "lz4-java"
-    report_json = make_report_json(
-        results=results,
-        project=project_name,
-        profile=args.profile,
-        duration=args.duration,
-        concurrency=args.jobs,
-        mvn_cmd=mvn_cmd_str,
-        out_dir=out_dir,
-        base_dir=base_dir,
-    )
-    json_path = Path(args.json_report).resolve()
-    html_path = Path(args.html_report).resolve()
-    json_path.parent.mkdir(parents=True, exist_ok=True)
-    html_path.parent.mkdir(parents=True, exist_ok=True)
-    json_path.write_text(json.dumps(report_json, indent=2), encoding="utf-8")
-    html_path.write_text(make_report_html(report_json), encoding="utf-8")
+    # Report batched runs per original execution
+    for key, res in list(results.items()):
+        if res.execution.members:
+            del results[key]
+            for r in expand_batched_result(res):
+                results[r.execution.execution_id] = r
+
+    json_path, html_path = write_reports(args, results, mvn_cmd_str, out_dir, base_dir, concurrency)
 
     # Final console summary
     total = len(results)
     passed = sum(1 for r in results.values() if r.status == "passed")
     failed = sum(1 for r in results.values() if r.status == "failed")
     cancelled = sum(1 for r in results.values() if r.status == "cancelled")
-    print(f"\n=== Fuzz summary: total={total} passed={passed} failed={failed} cancelled={cancelled}")
+    skipped = sum(1 for r in results.values() if r.status == "skipped")
+    print(f"\n=== Fuzz summary: total={total} passed={passed} failed={failed} cancelled={cancelled} skipped={skipped}")
+    if skipped:
+        # Only members of batched runs end up skipped: those targets were never exercised
+        print(f"Warning: {skipped} batched test(s) did not run, see the Surefire reports", file=sys.stderr)
     print(f"JSON report: {json_path}")
     print(f"HTML report: {html_path}")
 
-    return 0 if failed == 0 else 2
+    return 0 if failed == 0 and cancelled == 0 and skipped == 0 else 2
 
 
 class contextlib_suppress:
@@ -683,6 +1388,13 @@ class contextlib_suppress:
         return exctype is not None and issubclass(exctype, self.exceptions)
 
 
+def parse_shard(value: str) -> Tuple[int, int]:
+    m = re.match(r"^([0-9]+)/([0-9]+)$", value)
+    if not m or not 1 <= int(m.group(1)) <= int(m.group(2)):
+        raise argparse.ArgumentTypeError(f"invalid shard '{value}', expected I/N with 1 <= I <= N")
+    return int(m.group(1)), int(m.group(2))
+
+
 def parse_args(argv: List[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run lz4-java fuzz tests in parallel with isolated Maven executions.")
     parser.add_argument("--base-dir", default=".", help="Project base directory that contains pom.xml (default: .)")
@@ -695,10 +1407,15 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
     parser.add_argument("--html-report", default="fuzz-out/fuzz-report.html", help="Path to write final HTML report")
     parser.add_argument("-f", "--filter", default=None, help="Substring filter applied to execution id or test spec")
     parser.add_argument("--list", action="store_true", help="List detected fuzz tests and exit")
+    parser.add_argument("--shard", type=parse_shard, default=None, help="Run only shard I/N of the (filtered) executions, e.g. 1/4; executions are sorted by id and dealt round-robin")
     parser.add_argument("--no-batch", action="store_true", help="Do not pass -B to Maven (interactive/verbose)")
     parser.add_argument("--refresh", type=float, default=1.0, help="Status refresh interval seconds (default: 1.0)")
     parser.add_argument("--rss-limit-mb", type=int, default=1024, help="Per-test memory cap in MB enforced via libFuzzer (-rss_limit_mb) and ASAN (hard_rss_limit_mb) (default: 1024)")
+    parser.add_argument("--mem-slot-mb", type=int, default=256, help="Granularity in MB of the memory-aware scheduler; each job takes ceil((xmx + 200) / slot) slots out of a pool capped by available RAM (default: 256)")
     parser.add_argument("--xmx-mb", type=int, default=700, help="Max Java heap (-Xmx) for the forked test JVM in MB (default: 700)")
+    parser.add_argument("--no-offline", action="store_true", help="Do not pass -o to the per-test Maven runs (use if Surefire needs to resolve artifacts the warmup did not fetch)")
+    parser.add_argument("--batch-by-class", action="store_true", help="Run all selected methods of a test class in one Maven/Surefire invocation (-Dtest=Class#m1+m2); per-method status is read from the Surefire XML reports. Batched forks run in regression mode (-Djazzer.fuzz=0, i.e. JAZZER_FUZZ=0): existing inputs only, no fuzzing, since Jazzer fuzzes a single @FuzzTest per JVM; methods that did not run count as skipped and fail the run")
+    parser.add_argument("--workspace-mode", choices=WORKSPACE_MODES, default="symlink", help="How each job's work dir is populated from the project: full copy, symlink farm, or overlayfs mount (root on Linux, --out-dir outside the project; falls back to symlink with a warning) (default: symlink)")
     return parser.parse_args(argv)
 
 
@@ -708,29 +1425,15 @@ def main(argv: List[str]) -> int:
     if not re.match(r"^[0-9]+(ms|s|m|h)?$", args.duration):
         print(f"Warning: duration '{args.duration}' may not be valid for jazzer.max_duration", file=sys.stderr)
 
-    # Trap SIGINT to attempt graceful cancel
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    stop = asyncio.Event()
-
-    def handle_sigint():
-        try:
-            loop.remove_signal_handler(signal.SIGINT)
-        except Exception:
-            pass
-        stop.set()
-
-    try:
-        loop.add_signal_handler(signal.SIGINT, handle_sigint)
-    except NotImplementedError:
-        # Windows or limited environment
-        pass
-
+    # uvloop is an optional, faster drop-in event loop; uvloop.run replaces the
+    # deprecated uvloop.install() (older releases without it use asyncio.run)
     try:
-        rc = loop.run_until_complete(main_async(args))
-    finally:
-        loop.close()
-    return rc
+        import uvloop
+    except ImportError:
+        uvloop = None
+    if uvloop is not None and hasattr(uvloop, "run"):
+        return uvloop.run(main_async(args))
+    return asyncio.run(main_async(args))
 
 
 if __name__ == "__main__":